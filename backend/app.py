@@ -1,17 +1,192 @@
 import os
 import sys
-import json
-from flask import Flask, redirect, request, session, url_for, jsonify
+import asyncio
+import hashlib
+import operator
+import queue
+import random
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+import aiohttp
+import httplib2
+import orjson
+import redis
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from flask import Flask, g, redirect, request, session, jsonify
 from flask_cors import CORS
-from flask_session import Session
 import spotipy
 from spotipy.oauth2 import SpotifyOAuth
-from google_auth_oauthlib.flow import Flow
-from googleapiclient.discovery import build
+from googleapiclient.discovery import build_from_document
+from googleapiclient.discovery_cache import get_static_doc
 from google.auth.transport.requests import Request
 import google.oauth2.credentials
+from google_auth_httplib2 import AuthorizedHttp
 from exception import LoadError
 
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
+SPOTIFY_API_URL = "https://api.spotify.com/v1"
+SPOTIFY_PAGE_SIZE = 100
+SPOTIFY_TRACK_FIELDS = "items(track(name,artists(name))),total,next"
+YOUTUBE_API_URL = "https://www.googleapis.com/youtube/v3"
+YOUTUBE_DISCOVERY_URL = "https://www.googleapis.com/discovery/v1/apis/youtube/v3/rest"
+YOUTUBE_SEARCH_FIELDS = "items(id/videoId,snippet/title)"
+YOUTUBE_BATCH_SIZE = 50  # most calls the batch endpoint accepts at once
+SEARCH_CONCURRENCY = 10
+CONNECTION_LIMIT = 20
+DNS_CACHE_TTL = 300  # seconds
+ACCEPT_ENCODING = "gzip, br"
+SEARCH_CACHE_TTL = 30 * 86400  # seconds
+SEARCH_CACHE_SIZE = 10000
+RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+MAX_RETRIES = 5
+RETRY_BACKOFF = 0.5  # seconds, doubled on every attempt
+MAX_RETRY_AFTER = 60  # seconds; longer Retry-After waits fail the request instead
+TOKEN_REFRESH_MARGIN = timedelta(minutes=30)  # minimum token lifetime for a transfer
+
+# Shared HTTP transports so consecutive API calls reuse keep-alive connections
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=50,
+        max_retries=Retry(
+            total=MAX_RETRIES,
+            backoff_factor=RETRY_BACKOFF,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset(["GET", "POST"]),
+            respect_retry_after_header=True,
+        ),
+    ),
+)
+_SESSION.headers["Accept-Encoding"] = ACCEPT_ENCODING
+# Idle httplib2.Http transports; each one is used by a single request at a time
+_HTTP_POOL = queue.LifoQueue()
+
+# Credential attributes kept in the session, see credentials_to_dict
+_CREDENTIAL_FIELDS = ("token", "refresh_token", "token_uri", "scopes")
+_get_credential_fields = operator.attrgetter(*_CREDENTIAL_FIELDS)
+
+_name_of = operator.methodcaller("get", "name")
+
+# Release suffixes such as " - Remastered 2009", "(Mono Version)" or "(feat. X)"
+_CLEAN_RE = re.compile(
+    r"\s*(?:\s-\s|[(\[]).*?"
+    r"\b(?:remaster(?:ed)?|mono|stereo|version|edit|feat|ft|single|radio|explicit)\b.*$",
+    re.IGNORECASE,
+)
+
+# In-process LRU of YouTube search results, used when Redis is not configured
+_SEARCH_CACHE = OrderedDict()
+_SEARCH_CACHE_LOCK = threading.Lock()  # shared by every request thread
+
+
+def _pooled_http():
+    """
+    Check out a reusable httplib2.Http instance for the current request.
+
+    httplib2.Http is not thread-safe, so every request borrows its own from
+    _HTTP_POOL and hands it back in _release_http when the request ends; its
+    open connections are then reused by later requests on any thread.
+
+    Returns:
+        httplib2.Http: HTTP transport that keeps its connections open between calls.
+    """
+    if "http" not in g:
+        try:
+            g.http = _HTTP_POOL.get_nowait()
+        except queue.Empty:
+            g.http = httplib2.Http()
+    return g.http
+
+
+def _client_session():
+    """
+    Create an aiohttp session for concurrent Spotify and YouTube API requests.
+
+    Responses are requested compressed and decoded with orjson.
+
+    Returns:
+        aiohttp.ClientSession: A new session, to be used as an async context manager.
+    """
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=CONNECTION_LIMIT, use_dns_cache=True, ttl_dns_cache=DNS_CACHE_TTL
+        ),
+        headers={"Accept-Encoding": ACCEPT_ENCODING},
+        json_serialize=lambda obj: orjson.dumps(obj).decode(),
+    )
+
+
+def run_async(coro):
+    """
+    Run a coroutine to completion on a new event loop, using uvloop when installed.
+
+    The calling thread must not already be running an event loop. Every request
+    gets its own OS thread under gunicorn's gthread workers and Werkzeug's
+    threaded server, so each transfer owns its loop.
+
+    Args:
+        coro (coroutine): The coroutine to run.
+
+    Returns:
+        The coroutine's result.
+    """
+    if uvloop is None:
+        return asyncio.run(coro)
+    return uvloop.run(coro)
+
+
+async def _request_json(http_session, method, url, **kwargs):
+    """
+    Send an API request, retrying transient failures with exponential backoff.
+
+    Delays are randomized by +/-50% so concurrent tasks do not retry in lockstep,
+    and a numeric Retry-After header takes precedence over the computed delay.
+    A Retry-After longer than MAX_RETRY_AFTER fails the request right away
+    rather than tying up the worker.
+
+    Args:
+        http_session (aiohttp.ClientSession): The session to send the request with.
+        method (str): The HTTP method.
+        url (str): The request URL.
+        **kwargs: Extra arguments for aiohttp.ClientSession.request.
+
+    Returns:
+        dict: The decoded JSON response body.
+
+    Raises:
+        aiohttp.ClientError: If the request still fails after MAX_RETRIES retries.
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        delay = RETRY_BACKOFF * 2**attempt * random.uniform(0.5, 1.5)
+        try:
+            async with http_session.request(method, url, **kwargs) as response:
+                retry_after = response.headers.get("Retry-After", "")
+                if (
+                    response.status not in RETRY_STATUSES
+                    or attempt == MAX_RETRIES
+                    or (retry_after.isdigit() and int(retry_after) > MAX_RETRY_AFTER)
+                ):
+                    response.raise_for_status()
+                    return await response.json(loads=orjson.loads)
+                if retry_after.isdigit():
+                    delay = int(retry_after)
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if attempt == MAX_RETRIES:
+                raise
+        await asyncio.sleep(delay)
+
 # -------------------- Configuration Module --------------------
 
 def load_json(file_path):
@@ -27,18 +202,49 @@ def load_json(file_path):
     Raises:
         LoadError: If the file does not exist or contains invalid JSON.
     """
-    if not os.path.exists(file_path):
-        raise LoadError(source=file_path, message="Config file not found")
     try:
-        with open(file_path, "r") as f:
-            config = json.load(f)
+        with open(file_path, "rb") as f:
+            config = orjson.loads(f.read())
         return config
-    except json.JSONDecodeError as e:
+    except FileNotFoundError as e:
+        raise LoadError(
+            source=file_path, message="Config file not found", original_error=e
+        ) from e
+    except orjson.JSONDecodeError as e:
         raise LoadError(
             source=file_path, message="Invalid JSON format", original_error=e
         ) from e
 
 
+def load_youtube_discovery():
+    """
+    Load the YouTube Data API discovery document once at startup.
+
+    The copy bundled with google-api-python-client is preferred; the document is
+    only downloaded when the installed client does not ship one.
+
+    Returns:
+        str: The raw discovery document JSON.
+
+    Raises:
+        LoadError: If no bundled copy exists and the download fails.
+    """
+    document = get_static_doc("youtube", "v3")
+    if document is not None:
+        return document
+
+    try:
+        response = _SESSION.get(YOUTUBE_DISCOVERY_URL, timeout=30)
+        response.raise_for_status()
+        return response.text
+    except requests.RequestException as e:
+        raise LoadError(
+            source=YOUTUBE_DISCOVERY_URL,
+            message="Failed to download YouTube discovery document",
+            original_error=e,
+        ) from e
+
+
 # -------------------- Authentication Module --------------------
 
 
@@ -59,20 +265,11 @@ def get_spotify_client(config):
         raise LoadError(source="spotify_auth", message="Spotify not authenticated")
 
     try:
-        sp_oauth = SpotifyOAuth(
-            client_id=config["SPOTIPY_CLIENT_ID"],
-            client_secret=config["SPOTIPY_CLIENT_SECRET"],
-            redirect_uri=config["SPOTIFY_REDIRECT_URI"],
-            scope=config.get("SPOTIFY_SCOPE", "playlist-read-private"),
-            cache_handler=None,  # We are managing tokens manually
-            show_dialog=True,
-        )
-
-        token_info = sp_oauth.validate_token(session["spotify_token"])
+        token_info = spotify_oauth.validate_token(session["spotify_token"])
         if not token_info:
             raise LoadError(source="spotify_auth", message="Invalid Spotify token")
 
-        sp = spotipy.Spotify(auth=session["spotify_token"])
+        sp = spotipy.Spotify(auth=session["spotify_token"], requests_session=_SESSION)
         return sp
     except Exception as e:
         raise LoadError(
@@ -86,11 +283,15 @@ def get_youtube_client(config):
     """
     Get an authenticated YouTube client using tokens stored in the session.
 
+    The access token is refreshed unless it stays valid for TOKEN_REFRESH_MARGIN,
+    since transfers send it as a raw bearer token that nothing refreshes midway.
+
     Args:
         config (dict): Configuration dictionary.
 
     Returns:
-        googleapiclient.discovery.Resource: Authenticated YouTube client.
+        tuple: The YouTube client (googleapiclient.discovery.Resource) and its
+            valid credentials (google.oauth2.credentials.Credentials).
 
     Raises:
         LoadError: If authentication tokens are missing or invalid.
@@ -98,11 +299,22 @@ def get_youtube_client(config):
     if "youtube_credentials" not in session:
         raise LoadError(source="youtube_auth", message="YouTube not authenticated")
 
+    stored = dict(session["youtube_credentials"])
+    expiry = stored.pop("expiry", None)
+    client = youtube_client_config.get("web") or youtube_client_config["installed"]
     credentials = google.oauth2.credentials.Credentials(
-        **session["youtube_credentials"]
+        **stored,
+        client_id=client["client_id"],
+        client_secret=client["client_secret"],
+        expiry=datetime.fromisoformat(expiry) if expiry else None,
     )
 
-    if credentials and credentials.expired and credentials.refresh_token:
+    # google-auth expiry times are naive UTC
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    expires_soon = (
+        credentials.expiry is None or credentials.expiry - now < TOKEN_REFRESH_MARGIN
+    )
+    if credentials.refresh_token and (expires_soon or not credentials.valid):
         try:
             credentials.refresh(Request())
             session["youtube_credentials"] = credentials_to_dict(credentials)
@@ -114,8 +326,10 @@ def get_youtube_client(config):
             ) from e
 
     try:
-        youtube = build("youtube", "v3", credentials=credentials)
-        return youtube
+        youtube = build_from_document(
+            youtube_discovery, http=AuthorizedHttp(credentials, http=_pooled_http())
+        )
+        return youtube, credentials
     except Exception as e:
         raise LoadError(
             source="youtube_auth",
@@ -128,48 +342,97 @@ def credentials_to_dict(credentials):
     """
     Convert Credentials object to dict for storing in session.
 
+    The client ID and secret are left out since they come from the client
+    secrets file, which keeps the secret out of cookie-based sessions.
+
     Args:
         credentials (google.oauth2.credentials.Credentials): Credentials object.
 
     Returns:
         dict: Dictionary representation of credentials.
     """
-    return {
-        "token": credentials.token,
-        "refresh_token": credentials.refresh_token,
-        "token_uri": credentials.token_uri,
-        "client_id": credentials.client_id,
-        "client_secret": credentials.client_secret,
-        "scopes": credentials.scopes,
-    }
+    stored = dict(zip(_CREDENTIAL_FIELDS, _get_credential_fields(credentials)))
+    stored["expiry"] = credentials.expiry.isoformat() if credentials.expiry else None
+    return stored
 
 
 # -------------------- Spotify Module --------------------
 
 
-def get_spotify_playlist_tracks(sp, playlist_id):
+async def fetch_spotify_page(http_session, token, playlist_id, offset):
     """
-    Retrieve all tracks from a Spotify playlist.
+    Fetch a single page of tracks from a Spotify playlist.
 
     Args:
-        sp (spotipy.Spotify): An authenticated Spotipy client instance.
+        http_session (aiohttp.ClientSession): The HTTP session used for Spotify API requests.
+        token (str): Spotify access token.
         playlist_id (str): The Spotify Playlist ID to fetch tracks from.
+        offset (int): Index of the first track of the page.
 
     Returns:
-        list: A list of track items retrieved from the Spotify playlist.
+        list: The track items on the page.
+
+    Raises:
+        aiohttp.ClientError: If the Spotify API request fails.
+    """
+    page = await _request_json(
+        http_session,
+        "GET",
+        f"{SPOTIFY_API_URL}/playlists/{playlist_id}/tracks",
+        params={
+            "offset": offset,
+            "limit": SPOTIFY_PAGE_SIZE,
+            "fields": SPOTIFY_TRACK_FIELDS,
+        },
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    return page["items"]
+
+
+async def iter_spotify_playlist_tracks(sp, http_session, token, playlist_id):
+    """
+    Stream the tracks of a Spotify playlist as its pages arrive.
+
+    The first page reports the playlist size, after which every remaining page
+    is requested concurrently. Tracks are yielded in playlist order as soon as
+    the page holding them has loaded.
+
+    Args:
+        sp (spotipy.Spotify): An authenticated Spotipy client instance.
+        http_session (aiohttp.ClientSession): The HTTP session used for the remaining pages.
+        token (str): Spotify access token used for the concurrent page requests.
+        playlist_id (str): The Spotify Playlist ID to fetch tracks from.
+
+    Yields:
+        dict: Track items retrieved from the Spotify playlist.
 
     Raises:
-        LoadError: If fetching tracks fails due to a Spotipy exception.
+        LoadError: If fetching tracks fails due to a Spotipy or HTTP exception.
     """
-    tracks = []
+    pages = []
     try:
-        results = sp.playlist_tracks(playlist_id)
-        tracks.extend(results["items"])
-        while results["next"]:
-            results = sp.next(results)
-            tracks.extend(results["items"])
-        return tracks
-    except spotipy.SpotifyException as e:
+        results = sp.playlist_items(
+            playlist_id,
+            fields=SPOTIFY_TRACK_FIELDS,
+            limit=SPOTIFY_PAGE_SIZE,
+            offset=0,
+        )
+        if results["next"]:
+            pages = [
+                asyncio.create_task(
+                    fetch_spotify_page(http_session, token, playlist_id, offset)
+                )
+                for offset in range(
+                    SPOTIFY_PAGE_SIZE, results["total"], SPOTIFY_PAGE_SIZE
+                )
+            ]
+
+        for item in results["items"]:
+            yield item
+        for page in pages:
+            for item in await page:
+                yield item
+    except (spotipy.SpotifyException, aiohttp.ClientError) as e:
         raise LoadError(
             source=f"spotify_playlist_{playlist_id}",
             message="Failed to fetch playlist tracks",
@@ -181,54 +444,175 @@ def get_spotify_playlist_tracks(sp, playlist_id):
             message="Invalid playlist data format",
             original_error=e,
         ) from e
+    finally:
+        for page in pages:
+            page.cancel()
 
 
 # -------------------- YouTube Module --------------------
 
 
-def search_youtube_instrumental(youtube, track_name, artist_name):
+def clean_track_name(track_name):
+    """
+    Strip release suffixes from a Spotify track name before searching YouTube.
+
+    Args:
+        track_name (str): The name of the track as listed on Spotify.
+
+    Returns:
+        str: The track name without suffixes such as "- Remastered 2009" or "(feat. X)",
+            or the original name if nothing would be left.
+    """
+    return _CLEAN_RE.sub("", track_name).strip() or track_name
+
+
+def search_cache_key(track_name, artist_name):
+    """
+    Build the cache key for a YouTube instrumental search.
+
+    Args:
+        track_name (str): The name of the track.
+        artist_name (str): The name of the artist of the track.
+
+    Returns:
+        str: A key that is identical for case, width and whitespace variants of the same input.
+    """
+    normalized = "|".join(
+        " ".join(unicodedata.normalize("NFKC", part).casefold().split())
+        for part in (track_name, artist_name)
+    )
+    return f"yt:inst:{hashlib.sha1(normalized.encode()).hexdigest()}"
+
+
+def get_cached_search(key):
+    """
+    Look up a cached YouTube search result.
+
+    Args:
+        key (str): The key returned by search_cache_key.
+
+    Returns:
+        str or None: The cached video ID, an empty string if the search was cached as not found,
+                    or None if the key is not cached.
+    """
+    if redis_client is not None:
+        try:
+            value = redis_client.get(key)
+            return value.decode() if value is not None else None
+        except redis.RedisError:
+            pass
+
+    with _SEARCH_CACHE_LOCK:
+        value = _SEARCH_CACHE.get(key)
+        if value is not None:
+            _SEARCH_CACHE.move_to_end(key)
+    return value
+
+
+def set_cached_search(key, video_id):
+    """
+    Store a YouTube search result, including searches that found nothing.
+
+    Args:
+        key (str): The key returned by search_cache_key.
+        video_id (str or None): The video ID found, or None if no video matched.
+
+    Returns:
+        None
+    """
+    value = video_id or ""
+    if redis_client is not None:
+        try:
+            redis_client.setex(key, SEARCH_CACHE_TTL, value)
+            return
+        except redis.RedisError:
+            pass
+
+    with _SEARCH_CACHE_LOCK:
+        _SEARCH_CACHE[key] = value
+        _SEARCH_CACHE.move_to_end(key)
+        if len(_SEARCH_CACHE) > SEARCH_CACHE_SIZE:
+            _SEARCH_CACHE.popitem(last=False)
+
+
+def score_instrumental_title(item):
+    """
+    Score how likely a search result is an instrumental or karaoke version.
+
+    Args:
+        item (dict): A YouTube search result item.
+
+    Returns:
+        int: Positive for instrumental or karaoke titles, negative for reactions and covers.
+    """
+    title = item["snippet"]["title"].lower()
+    return (
+        2 * ("instrumental" in title)
+        + ("karaoke" in title)
+        - 3 * ("reaction" in title or "cover" in title)
+    )
+
+
+async def search_youtube_instrumental(http_session, token, track_name, artist_name):
     """
     Search YouTube for an instrumental or karaoke version of a track.
 
     Args:
-        youtube (googleapiclient.discovery.Resource): An authenticated YouTube client instance.
+        http_session (aiohttp.ClientSession): The HTTP session used for YouTube API requests.
+        token (str): OAuth 2.0 access token for the YouTube Data API.
         track_name (str): The name of the track to search for.
         artist_name (str): The name of the artist of the track.
 
     Returns:
-        str or None: The YouTube video ID of the first matching instrumental or karaoke video found.
+        str or None: The YouTube video ID of the best scoring instrumental or karaoke video found.
                     Returns None if no suitable video is found.
 
     Raises:
         LoadError: If the YouTube API request fails.
+
+    Notes:
+        A single query covers both instrumental and karaoke versions, and results are ranked
+        by score_instrumental_title. Results are cached by search_cache_key, so repeated tracks cost no API quota.
     """
-    queries = [
-        f"{track_name} {artist_name} instrumental",
-        f"{track_name} {artist_name} karaoke",
-    ]
+    key = search_cache_key(track_name, artist_name)
+    cached = get_cached_search(key)
+    if cached is not None:
+        return cached or None
 
-    for query in queries:
-        try:
-            request = youtube.search().list(
-                part="snippet",
-                maxResults=5,
-                q=query,
-                type="video",
-                videoCategoryId="10",  # Music category
-            )
-            response = request.execute()
-            for item in response.get("items", []):
-                title = item["snippet"]["title"].lower()
-                if "instrumental" in title or "karaoke" in title:
-                    return item["id"]["videoId"]
-        except Exception as e:
-            raise LoadError(
-                source="youtube_search",
-                message=f"Failed to search for '{track_name}' by '{artist_name}'",
-                original_error=e,
-            ) from e
+    query = f'"{track_name}" {artist_name} (instrumental|karaoke)'
+
+    try:
+        data = await _request_json(
+            http_session,
+            "GET",
+            f"{YOUTUBE_API_URL}/search",
+            params={
+                "part": "snippet",
+                "maxResults": 10,
+                "q": query,
+                "type": "video",
+                "videoCategoryId": "10",  # Music category
+                "fields": YOUTUBE_SEARCH_FIELDS,
+            },
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        items = data.get("items", [])
+    except Exception as e:
+        raise LoadError(
+            source="youtube_search",
+            message=f"Failed to search for '{track_name}' by '{artist_name}'",
+            original_error=e,
+        ) from e
+
+    # max() keeps the first of equally scored items, i.e. YouTube's ranking
+    best = max(items, key=score_instrumental_title, default=None)
+    if best is None or score_instrumental_title(best) <= 0:
+        set_cached_search(key, None)
+        return None  # No matching instrumental/karaoke version found
 
-    return None  # No matching instrumental/karaoke version found
+    video_id = best["id"]["videoId"]
+    set_cached_search(key, video_id)
+    return video_id
 
 
 def create_youtube_playlist(youtube, title, description=""):
@@ -249,12 +633,13 @@ def create_youtube_playlist(youtube, title, description=""):
     try:
         request = youtube.playlists().insert(
             part="snippet,status",
+            fields="id",
             body={
                 "snippet": {"title": title, "description": description},
                 "status": {"privacyStatus": "private"},
             },
         )
-        response = request.execute()
+        response = request.execute(num_retries=MAX_RETRIES)
         return response["id"]
     except Exception as e:
         raise LoadError(
@@ -264,38 +649,202 @@ def create_youtube_playlist(youtube, title, description=""):
         ) from e
 
 
-def add_video_to_playlist(youtube, playlist_id, video_id):
+def add_videos_to_playlist(youtube, playlist_id, video_ids):
     """
-    Add a video to a YouTube playlist.
+    Add videos to a YouTube playlist, sending up to YOUTUBE_BATCH_SIZE inserts per HTTP request.
 
     Args:
         youtube (googleapiclient.discovery.Resource): An authenticated YouTube client instance.
-        playlist_id (str): The ID of the YouTube playlist to add the video to.
-        video_id (str): The YouTube video ID to be added to the playlist.
+        playlist_id (str): The ID of the YouTube playlist to add the videos to.
+        video_ids (list of str): The YouTube video IDs to be added to the playlist.
 
     Returns:
-        None
+        dict: Maps the position in video_ids of every video that could not be added to its LoadError.
+    """
+    failures = {}
+
+    def on_insert(request_id, response, exception):
+        if exception is not None:
+            idx = int(request_id)
+            failures[idx] = LoadError(
+                source="add video",
+                message=f"Failed to add {video_ids[idx]} to {playlist_id}",
+                original_error=exception,
+            )
+
+    for start in range(0, len(video_ids), YOUTUBE_BATCH_SIZE):
+        chunk = range(start, min(start + YOUTUBE_BATCH_SIZE, len(video_ids)))
+        batch = youtube.new_batch_http_request(callback=on_insert)
+        for idx in chunk:
+            batch.add(
+                youtube.playlistItems().insert(
+                    part="snippet",
+                    fields="id",
+                    body={
+                        "snippet": {
+                            "playlistId": playlist_id,
+                            "resourceId": {
+                                "kind": "youtube#video",
+                                "videoId": video_ids[idx],
+                            },
+                        }
+                    },
+                ),
+                request_id=str(idx),
+            )
+        try:
+            batch.execute()
+        except Exception as e:
+            for idx in chunk:
+                on_insert(str(idx), None, e)
+
+    return failures
+
+
+# -------------------- Transfer Module --------------------
+
+
+async def transfer_tracks(
+    sp,
+    spotify_token,
+    spotify_playlist_id,
+    youtube,
+    youtube_token,
+    youtube_title,
+    youtube_description="",
+):
+    """
+    Transfer the tracks of a Spotify playlist to a new YouTube playlist.
+
+    Spotify tracks are streamed into a queue drained by SEARCH_CONCURRENCY search
+    workers, so YouTube searches start while later pages are still loading, and
+    duplicate tracks share a single search. The YouTube playlist is created once
+    every track has been searched, and the matches are then added in batched
+    inserts.
+
+    Args:
+        sp (spotipy.Spotify): An authenticated Spotipy client instance.
+        spotify_token (str): Spotify access token.
+        spotify_playlist_id (str): The Spotify Playlist ID to transfer.
+        youtube (googleapiclient.discovery.Resource): An authenticated YouTube client instance.
+        youtube_token (str): OAuth 2.0 access token for the YouTube Data API.
+        youtube_title (str): The title of the new YouTube playlist.
+        youtube_description (str, optional): The description of the new YouTube playlist.
+
+    Returns:
+        dict: total_tracks, added_videos, not_found and the list of error messages.
 
     Raises:
-        LoadError: If adding the video fails.
+        LoadError: If the Spotify tracks cannot be fetched or the YouTube playlist cannot be created.
     """
-    try:
-        request = youtube.playlistItems().insert(
-            part="snippet",
-            body={
-                "snippet": {
-                    "playlistId": playlist_id,
-                    "resourceId": {"kind": "youtube#video", "videoId": video_id},
-                }
-            },
+    tracks_queue = asyncio.Queue(maxsize=SEARCH_CONCURRENCY * 2)
+    searched = {}  # track index -> (track_name, artist_names, video ID or exception)
+    searches = {}  # search_cache_key -> search task shared by duplicate tracks
+
+    async with _client_session() as http_session:
+
+        async def produce():
+            total_tracks = 0
+            async for item in iter_spotify_playlist_tracks(
+                sp, http_session, spotify_token, spotify_playlist_id
+            ):
+                total_tracks += 1
+                await tracks_queue.put((total_tracks, item))
+            for _ in range(SEARCH_CONCURRENCY):
+                await tracks_queue.put(None)
+            return total_tracks
+
+        async def search_worker():
+            while (entry := await tracks_queue.get()) is not None:
+                idx, item = entry
+                track_name = artist_names = ""
+                try:
+                    track = item.get("track")
+                    if not track or not track.get("name"):
+                        searched[idx] = None
+                        continue
+
+                    track_name = track["name"]
+                    artist_names = ", ".join(
+                        filter(None, map(_name_of, track.get("artists") or []))
+                    )
+                    search_name = clean_track_name(track_name)
+                    key = search_cache_key(search_name, artist_names)
+                    if key not in searches:
+                        searches[key] = asyncio.create_task(
+                            search_youtube_instrumental(
+                                http_session, youtube_token, search_name, artist_names
+                            )
+                        )
+                    video_id = await searches[key]
+                except Exception as e:
+                    video_id = e
+                searched[idx] = (track_name, artist_names, video_id)
+
+        # Stop everything as soon as the producer or a worker fails, so a
+        # blocked tracks_queue.put() can never outlive the workers that drain it
+        producer = asyncio.create_task(produce())
+        workers = [
+            asyncio.create_task(search_worker()) for _ in range(SEARCH_CONCURRENCY)
+        ]
+        try:
+            done, _ = await asyncio.wait(
+                [producer, *workers], return_when=asyncio.FIRST_EXCEPTION
+            )
+            for task in done:
+                if task.exception() is not None:
+                    raise task.exception()
+        finally:
+            for task in (producer, *workers, *searches.values()):
+                task.cancel()
+        total_tracks = producer.result()
+
+        youtube_playlist_id = create_youtube_playlist(
+            youtube, youtube_title, youtube_description
         )
-        request.execute()
-    except Exception as e:
-        raise LoadError(
-            source="add video",
-            message=f"Failed to add {video_id} to {playlist_id}",
-            original_error=e,
-        ) from e
+
+        matched = [
+            idx
+            for idx, entry in sorted(searched.items())
+            if entry is not None and isinstance(entry[2], str)
+        ]
+        failures = add_videos_to_playlist(
+            youtube, youtube_playlist_id, [searched[idx][2] for idx in matched]
+        )
+        failed = {matched[pos]: error for pos, error in failures.items()}
+
+        errors = []
+        added_videos = 0
+        not_found = 0
+
+        for idx in range(1, total_tracks + 1):
+            if searched[idx] is None:
+                errors.append(f"Skipping item {idx}: No track information.")
+                continue
+
+            track_name, artist_names, video_id = searched[idx]
+            try:
+                if isinstance(video_id, BaseException):
+                    raise video_id
+                if idx in failed:
+                    raise failed[idx]
+                if video_id:
+                    added_videos += 1
+                else:
+                    not_found += 1
+            except Exception as e:
+                error_msg = (
+                    f"Error processing '{track_name}' by '{artist_names}': {str(e)}"
+                )
+                errors.append(error_msg)
+                continue
+
+    return {
+        "total_tracks": total_tracks,
+        "added_videos": added_videos,
+        "not_found": not_found,
+        "errors": errors,
+    }
 
 
 # -------------------- Flask App Setup --------------------
@@ -304,26 +853,67 @@ app = Flask(__name__)
 
 # Load configuration
 try:
-    config = load_json("config.json")
+    config = MappingProxyType(load_json("config.json"))
+    youtube_client_config = load_json(config["YOUTUBE_CLIENT_SECRETS_FILE"])
+    youtube_discovery = load_youtube_discovery()
 except LoadError as e:
     print(str(e))
     if e.original_error:
         print(f"Original error: {e.original_error}")
     sys.exit(1)
 
+app.config["APP_CONFIG"] = config
+
+# OAuth clients are built once and shared by every request
+spotify_oauth = SpotifyOAuth(
+    client_id=config["SPOTIPY_CLIENT_ID"],
+    client_secret=config["SPOTIPY_CLIENT_SECRET"],
+    redirect_uri=config["SPOTIFY_REDIRECT_URI"],
+    scope=config.get("SPOTIFY_SCOPE", "playlist-read-private"),
+    cache_handler=None,  # We are managing tokens manually
+    show_dialog=True,
+)
+
+# Shared cache for YouTube search results, falls back to an in-process LRU
+redis_client = (
+    redis.Redis.from_url(config["REDIS_URL"]) if config.get("REDIS_URL") else None
+)
+
 # Secret key for session management
 app.secret_key = (
     os.getenv("FLASK_SECRET_KEY") or config.get("SECRET_KEY") or "supersecretkey"
 )
 
-# Configure server-side session
-app.config["SESSION_TYPE"] = "filesystem"
-app.config["SESSION_PERMANENT"] = False
-Session(app)
+# Keep sessions in Redis when available, otherwise use Flask's signed cookie
+if redis_client is not None:
+    app.config["SESSION_TYPE"] = "redis"
+    app.config["SESSION_REDIS"] = redis_client
+    app.config["SESSION_PERMANENT"] = False
+
+    from flask_session import Session
+
+    Session(app)
 
 # Enable CORS
 CORS(app, supports_credentials=True, origins=["http://localhost:3000"])
 
+
+@app.teardown_appcontext
+def _release_http(error):
+    """
+    Return the httplib2.Http borrowed by the request, if any, to the pool.
+
+    Args:
+        error (Exception or None): The exception that ended the request, if any.
+
+    Returns:
+        None
+    """
+    http = g.pop("http", None)
+    if http is not None:
+        _HTTP_POOL.put(http)
+
+
 # -------------------- Routes --------------------
 
 
@@ -332,15 +922,7 @@ def auth_spotify():
     """
     Initiate Spotify OAuth flow.
     """
-    sp_oauth = SpotifyOAuth(
-        client_id=config["SPOTIPY_CLIENT_ID"],
-        client_secret=config["SPOTIPY_CLIENT_SECRET"],
-        redirect_uri=config["SPOTIFY_REDIRECT_URI"],
-        scope=config.get("SPOTIFY_SCOPE", "playlist-read-private"),
-        cache_handler=None,  # We are managing tokens manually
-        show_dialog=True,
-    )
-    auth_url = sp_oauth.get_authorize_url()
+    auth_url = spotify_oauth.get_authorize_url()
     return redirect(auth_url)
 
 
@@ -349,15 +931,6 @@ def callback_spotify():
     """
     Handle Spotify OAuth callback.
     """
-    sp_oauth = SpotifyOAuth(
-        client_id=config["SPOTIPY_CLIENT_ID"],
-        client_secret=config["SPOTIPY_CLIENT_SECRET"],
-        redirect_uri=config["SPOTIFY_REDIRECT_URI"],
-        scope=config.get("SPOTIFY_SCOPE", "playlist-read-private"),
-        cache_handler=None,
-        show_dialog=True,
-    )
-
     code = request.args.get("code")
     error = request.args.get("error")
 
@@ -369,7 +942,7 @@ def callback_spotify():
 
     if code:
         try:
-            token_info = sp_oauth.get_access_token(code, check_cache=False)
+            token_info = spotify_oauth.get_access_token(code, check_cache=False)
             session["spotify_token"] = token_info["access_token"]
             return jsonify(
                 {"status": "success", "message": "Spotify authenticated successfully"}
@@ -394,8 +967,10 @@ def auth_youtube():
     """
     Initiate YouTube OAuth flow.
     """
-    flow = Flow.from_client_secrets_file(
-        config["YOUTUBE_CLIENT_SECRETS_FILE"],
+    from google_auth_oauthlib.flow import Flow  # deferred, only the YouTube routes need it
+
+    flow = Flow.from_client_config(
+        youtube_client_config,
         scopes=config["YOUTUBE_SCOPES"],
         redirect_uri="http://localhost:5000/auth/youtube/callback",
     )
@@ -418,8 +993,10 @@ def callback_youtube():
             400,
         )
 
-    flow = Flow.from_client_secrets_file(
-        config["YOUTUBE_CLIENT_SECRETS_FILE"],
+    from google_auth_oauthlib.flow import Flow
+
+    flow = Flow.from_client_config(
+        youtube_client_config,
         scopes=config["YOUTUBE_SCOPES"],
         state=state,
         redirect_uri="http://localhost:5000/auth/youtube/callback",
@@ -486,60 +1063,27 @@ def transfer_playlist():
         return jsonify({"status": "error", "message": "YouTube not authenticated"}), 401
 
     try:
-        # Authenticate with Spotify
+        # Authenticate with Spotify and YouTube
         sp = get_spotify_client(config)
-
-        # Fetch Spotify playlist tracks
-        tracks = get_spotify_playlist_tracks(sp, playlist_id)
-
-        # Authenticate with YouTube
-        youtube = get_youtube_client(config)
-
-        # Create YouTube playlist
-        youtube_playlist_id = create_youtube_playlist(
-            youtube, youtube_title, youtube_description
+        youtube, youtube_credentials = get_youtube_client(config)
+
+        # Stream the Spotify tracks into YouTube searches, then fill the new playlist
+        details = run_async(
+            transfer_tracks(
+                sp,
+                session["spotify_token"],
+                playlist_id,
+                youtube,
+                youtube_credentials.token,
+                youtube_title,
+                youtube_description,
+            )
         )
 
-        # Process tracks
-        errors = []
-        added_videos = 0
-        not_found = 0
-
-        for idx, item in enumerate(tracks, start=1):
-            track = item.get("track")
-            if not track:
-                errors.append(f"Skipping item {idx}: No track information.")
-                continue
-
-            track_name = track.get("name")
-            artists = track.get("artists", [])
-            artist_names = ", ".join([artist.get("name") for artist in artists])
-
-            try:
-                video_id = search_youtube_instrumental(
-                    youtube, track_name, artist_names
-                )
-                if video_id:
-                    add_video_to_playlist(youtube, youtube_playlist_id, video_id)
-                    added_videos += 1
-                else:
-                    not_found += 1
-            except LoadError as e:
-                error_msg = (
-                    f"Error processing '{track_name}' by '{artist_names}': {str(e)}"
-                )
-                errors.append(error_msg)
-                continue
-
         result = {
             "status": "success",
             "message": "Playlist transfer completed.",
-            "details": {
-                "total_tracks": len(tracks),
-                "added_videos": added_videos,
-                "not_found": not_found,
-                "errors": errors,
-            },
+            "details": details,
         }
 
         return jsonify(result), 200
@@ -575,4 +1119,5 @@ def internal_error(error):
 # -------------------- Run the App --------------------
 
 if __name__ == "__main__":
-    app.run(debug=True)
+    # Development fallback; use wsgi.py under gunicorn for production
+    app.run(debug=False, threaded=True)
@@ -1,12 +1,17 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-@dataclass
+@dataclass(slots=True)
 class LoadError(Exception):
     """Raise an exception where data loading fails"""
 
     source: str
     message: str
     original_error: Exception | None = None
+    _msg: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Formatted once, str() is called again for every log line and JSON response
+        self._msg = f"Failed to load from {self.source}: {self.message}"
 
     def __str__(self):
-        return f"Failed to load from {self.source}: {self.message}"
+        return self._msg
@@ -0,0 +1,6 @@
+# Run with: gunicorn -k gthread -w 4 --threads 8 --preload wsgi:app
+#
+# Each /transfer drives its own asyncio event loop, which needs a real OS thread
+# per request: greenlet-based workers (gevent, eventlet) share one thread and
+# therefore one running-loop slot, so concurrent transfers would collide.
+from app import app
@@ -1,11 +1,53 @@
-import os
+import re
 import sys
 import json
-from dataclasses import dataclass
+import atexit
+import functools
+import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from dataclasses import dataclass, field
+import aiohttp
+import httplib2
+from tenacity import (
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 import spotipy
+from spotipy.cache_handler import CacheFileHandler
 from spotipy.oauth2 import SpotifyOAuth
+from google.auth.exceptions import RefreshError
+from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
+from tqdm.asyncio import tqdm as atqdm
+
+try:
+    import orjson
+except ImportError:  # fall back to the standard library parser
+    orjson = None
+
+YOUTUBE_API_URL = "https://www.googleapis.com/youtube/v3"
+DEFAULT_RATE_LIMIT = 10  # requests per second
+DEFAULT_CONCURRENCY = 5
+SPOTIFY_PAGE_WORKERS = 10
+SEARCH_CACHE_FILE = ".yt_cache.json"
+SPOTIFY_TOKEN_CACHE = ".spotipy_cache"
+YOUTUBE_TOKEN_FILE = ".yt_token.json"
+# Cached tokens closer than this to expiry are refreshed, since the searches send
+# the raw access token and nothing refreshes it mid-run
+TOKEN_REFRESH_MARGIN = timedelta(minutes=30)
+MAX_RETRIES = 5
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRY_AFTER = 60  # seconds; longer Retry-After waits give up instead
+YOUTUBE_BATCH_SIZE = 50  # maximum calls per batch request
+
+_INSTR_RE = re.compile(r"instrumental|karaoke", re.IGNORECASE)
 
 # -------------------- Configuration Module --------------------
 
@@ -35,18 +77,141 @@ def load_json(file_path):
     Exits:
         If the file does not exist or contains invalid JSON, the program exits with an error message.
     """
-    if not os.path.exists(file_path):
-        raise LoadError(source=file_path, message="Config file not found")
     try:
-        with open(file_path, "r") as f:
-            config = json.load(f)
+        with open(file_path, "rb") as f:
+            data = f.read()
+        config = orjson.loads(data) if orjson else json.loads(data)
         return config
+    except FileNotFoundError as e:
+        raise LoadError(
+            source=file_path, message="Config file not found", original_error=e
+        ) from e
     except json.JSONDecodeError as e:
         raise LoadError(
             source=file_path, message="Invalid JSON format", original_error=e
         ) from e
 
 
+# -------------------- HTTP Module --------------------
+
+
+@dataclass
+class RateLimiter:
+    """Token bucket limiting how many API requests start per second"""
+
+    rate: float
+    capacity: float = field(init=False)
+    tokens: float = field(init=False)
+    last_refill: float = field(init=False, default_factory=time.monotonic)
+    _lock: asyncio.Lock = field(init=False, repr=False, default_factory=asyncio.Lock)
+
+    def __post_init__(self):
+        if self.rate <= 0:
+            raise ValueError(f"rate must be positive, got {self.rate}")
+        # Hold at least one token so rates below one request per second still work
+        self.capacity = max(1.0, self.rate)
+        self.tokens = self.capacity
+
+    async def acquire(self):
+        """
+        Wait until a request may be sent and take a token for it.
+
+        Returns:
+            None
+        """
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                elapsed = now - self.last_refill
+                self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+                self.last_refill = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+_backoff = wait_exponential_jitter(initial=1, max=60)
+
+
+def _retry_after(error):
+    """
+    Read the numeric Retry-After header of a failed response.
+
+    Args:
+        error (BaseException): The exception raised by the request.
+
+    Returns:
+        int or None: The requested wait in seconds, or None if the header is absent.
+    """
+    retry_after = (getattr(error, "headers", None) or {}).get("Retry-After", "")
+    return int(retry_after) if retry_after.isdigit() else None
+
+
+def _is_transient(error):
+    """
+    Tell whether a failed API request is worth retrying.
+
+    Args:
+        error (BaseException): The exception raised by the request.
+
+    Returns:
+        bool: True for connection errors and rate limited or server error responses,
+            unless the server asks to wait longer than MAX_RETRY_AFTER.
+    """
+    if isinstance(error, aiohttp.ClientResponseError):
+        retry_after = _retry_after(error)
+        if retry_after is not None and retry_after > MAX_RETRY_AFTER:
+            return False
+        return error.status in RETRY_STATUSES
+    return isinstance(error, aiohttp.ClientConnectionError)
+
+
+def _retry_wait(retry_state):
+    """
+    Wait as long as the server's Retry-After header asks, or back off exponentially with jitter.
+
+    Args:
+        retry_state (tenacity.RetryCallState): The state of the request being retried.
+
+    Returns:
+        float: The number of seconds to wait before the next attempt.
+    """
+    retry_after = _retry_after(retry_state.outcome.exception())
+    if retry_after is not None:
+        return min(retry_after, MAX_RETRY_AFTER)
+    return _backoff(retry_state)
+
+
+@retry(
+    retry=retry_if_exception(_is_transient),
+    wait=_retry_wait,
+    stop=stop_after_attempt(MAX_RETRIES + 1),
+    reraise=True,
+)
+async def api_request(http_session, limiter, method, url, **kwargs):
+    """
+    Send a rate limited API request, retrying transient failures.
+
+    Args:
+        http_session (aiohttp.ClientSession): The session to send the request with.
+        limiter (RateLimiter): The rate limiter shared by all requests.
+        method (str): The HTTP method.
+        url (str): The request URL.
+        **kwargs: Extra arguments for aiohttp.ClientSession.request.
+
+    Returns:
+        dict: The decoded JSON response body.
+
+    Raises:
+        aiohttp.ClientError: If the request fails, or still fails after MAX_RETRIES retries.
+    """
+    await limiter.acquire()
+    async with http_session.request(method, url, **kwargs) as response:
+        response.raise_for_status()
+        return await response.json()
+
+
 # -------------------- Authentication Module --------------------
 
 
@@ -75,6 +240,7 @@ def authenticate_spotify(config):
                 client_secret=config["SPOTIPY_CLIENT_SECRET"],
                 redirect_uri=config["SPOTIFY_REDIRECT_URI"],
                 scope=config.get("SPOTIFY_SCOPE", "playlist-read-private"),
+                cache_handler=CacheFileHandler(cache_path=SPOTIFY_TOKEN_CACHE),
             )
         )
         return sp
@@ -92,30 +258,76 @@ def authenticate_spotify(config):
         ) from e
 
 
-def authenticate_youtube(client_secrets_file, scopes):
+def load_youtube_credentials(token_file, scopes):
+    """
+    Load cached YouTube OAuth 2.0 credentials, refreshing them unless they are valid
+    for at least TOKEN_REFRESH_MARGIN.
+
+    Args:
+        token_file (str): Path to the token file written by a previous run.
+        scopes (list of str): A list of OAuth 2.0 scopes required for YouTube API access.
+
+    Returns:
+        google.oauth2.credentials.Credentials or None: Valid credentials, or None if the
+            token file is missing, unreadable or can no longer be refreshed.
+    """
+    try:
+        credentials = Credentials.from_authorized_user_file(token_file, scopes)
+    except (OSError, ValueError):
+        return None
+
+    # google-auth expiry times are naive UTC
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    expires_soon = (
+        credentials.expiry is None or credentials.expiry - now < TOKEN_REFRESH_MARGIN
+    )
+    if credentials.valid and not expires_soon:
+        return credentials
+    if credentials.refresh_token:
+        try:
+            credentials.refresh(Request())
+            return credentials
+        except RefreshError:
+            return None
+    return None
+
+
+def authenticate_youtube(client_secrets_file, scopes, token_file=YOUTUBE_TOKEN_FILE):
     """
     Authenticate with YouTube using OAuth 2.0 and return the YouTube client.
 
+    Credentials cached in token_file are reused when possible; the installed-app flow
+    only runs when they are missing or cannot be refreshed, and its result is cached.
+
     Args:
         client_secrets_file (str): Path to the YouTube API client secrets JSON file.
         scopes (list of str): A list of OAuth 2.0 scopes required for YouTube API access.
+        token_file (str, optional): Path to the cached YouTube token. Defaults to YOUTUBE_TOKEN_FILE.
 
     Returns:
-        googleapiclient.discovery.Resource: An authenticated YouTube client instance.
+        tuple: The authenticated YouTube client instance (googleapiclient.discovery.Resource)
+            and its OAuth 2.0 credentials (google.oauth2.credentials.Credentials).
 
     Raises:
         LoadError: If the client secrets file is not found or authentication fails.
     """
-    if not os.path.exists(client_secrets_file):
-        raise LoadError(
-            source=client_secrets_file, message="YouTube client secrets file not found"
-        )
-
     try:
-        flow = InstalledAppFlow.from_client_secrets_file(client_secrets_file, scopes)
-        credentials = flow.run_local_server(port=0)
-        youtube = build("youtube", "v3", credentials=credentials)
-        return youtube
+        credentials = load_youtube_credentials(token_file, scopes)
+        if credentials is None:
+            flow = InstalledAppFlow.from_client_secrets_file(client_secrets_file, scopes)
+            credentials = flow.run_local_server(port=0)
+        with open(token_file, "w") as f:
+            f.write(credentials.to_json())
+        # One keep-alive connection for every call, and the bundled discovery document
+        http = AuthorizedHttp(credentials, http=httplib2.Http(cache=None))
+        youtube = build("youtube", "v3", http=http, static_discovery=True)
+        return youtube, credentials
+    except FileNotFoundError as e:
+        raise LoadError(
+            source=client_secrets_file,
+            message="YouTube client secrets file not found",
+            original_error=e,
+        ) from e
     except Exception as e:
         raise LoadError(
             source="youtube_auth",
@@ -127,28 +339,43 @@ def authenticate_youtube(client_secrets_file, scopes):
 # -------------------- Spotify Module --------------------
 
 
-def get_spotify_playlist_tracks(sp, playlist_id):
+async def iter_spotify_tracks(sp, playlist_id):
     """
-    Retrieve all tracks from a Spotify playlist.
+    Stream the tracks of a Spotify playlist as its pages arrive.
 
     Args:
         sp (spotipy.Spotify): An authenticated Spotipy client instance.
         playlist_id (str): The Spotify Playlist ID to fetch tracks from.
 
-    Returns:
-        list: A list of track items retrieved from the Spotify playlist.
+    Yields:
+        dict: Track items retrieved from the Spotify playlist, in playlist order.
 
     Raises:
         LoadError: If fetching tracks fails due to a Spotipy exception.
+
+    Notes:
+        The first page is yielded as soon as it arrives, while every remaining page is
+        fetched concurrently on a thread pool, since Spotipy itself is synchronous.
     """
-    tracks = []
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=SPOTIFY_PAGE_WORKERS)
+    pages = []
     try:
         results = sp.playlist_tracks(playlist_id)
-        tracks.extend(results["items"])
-        while results["next"]:
-            results = sp.next(results)
-            tracks.extend(results["items"])
-        return tracks
+        limit = results["limit"]
+        pages = [
+            loop.run_in_executor(
+                executor,
+                functools.partial(sp.playlist_tracks, playlist_id, offset=offset),
+            )
+            for offset in range(limit, results["total"], limit)
+        ]
+
+        for item in results["items"]:
+            yield item
+        for page in pages:
+            for item in (await page)["items"]:
+                yield item
     except spotipy.SpotifyException as e:
         raise LoadError(
             source=f"spotify_playlist_{playlist_id}",
@@ -161,17 +388,74 @@ def get_spotify_playlist_tracks(sp, playlist_id):
             message="Invalid playlist data format",
             original_error=e,
         ) from e
+    finally:
+        for page in pages:
+            page.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
 
 
 # -------------------- YouTube Module --------------------
 
 
-def search_youtube_instrumental(youtube, track_name, artist_name):
+@functools.lru_cache(maxsize=None)
+def _search_key(track_name, artist_name):
+    """
+    Build the search cache key for a track.
+
+    Args:
+        track_name (str): The name of the track.
+        artist_name (str): The name of the artist of the track.
+
+    Returns:
+        str: A key that is identical for case and whitespace variants of the same input.
+    """
+    return "|".join(
+        re.sub(r"\s+", " ", part.lower().strip()) for part in (track_name, artist_name)
+    )
+
+
+def load_search_cache(file_path):
+    """
+    Load the YouTube search results cached by earlier runs.
+
+    Args:
+        file_path (str): The path to the JSON cache file.
+
+    Returns:
+        dict: Maps search keys to a video ID, or to None for tracks with no instrumental.
+              Empty if the file does not exist or is unreadable.
+    """
+    try:
+        return load_json(file_path)
+    except LoadError:
+        return {}
+
+
+def save_search_cache(file_path, cache):
+    """
+    Write the YouTube search cache so later runs can skip known tracks.
+
+    Args:
+        file_path (str): The path to the JSON cache file.
+        cache (dict): Maps search keys to a video ID or None.
+
+    Returns:
+        None
+    """
+    with open(file_path, "w") as f:
+        json.dump(cache, f)
+
+
+async def search_youtube_instrumental(
+    http_session, limiter, token, track_name, artist_name
+):
     """
     Search YouTube for an instrumental or karaoke version of a track.
 
     Args:
-        youtube (googleapiclient.discovery.Resource): An authenticated YouTube client instance.
+        http_session (aiohttp.ClientSession): The HTTP session used for YouTube API requests.
+        limiter (RateLimiter): The rate limiter shared by all API requests.
+        token (str): OAuth 2.0 access token for the YouTube Data API.
         track_name (str): The name of the track to search for.
         artist_name (str): The name of the artist of the track.
 
@@ -185,31 +469,32 @@ def search_youtube_instrumental(youtube, track_name, artist_name):
     Notes:
         The search prioritizes videos with "instrumental" or "karaoke" in the title within the Music category.
     """
-    queries = [
-        f"{track_name} {artist_name} instrumental",
-        f"{track_name} {artist_name} karaoke",
-    ]
+    query = f"{track_name} {artist_name} instrumental OR karaoke"
 
-    for query in queries:
-        try:
-            request = youtube.search().list(
-                part="snippet",
-                maxResults=5,
-                q=query,
-                type="video",
-                videoCategoryId="10",  # Music category
-            )
-            response = request.execute()
-            for item in response.get("items", []):
-                title = item["snippet"]["title"].lower()
-                if "instrumental" in title or "karaoke" in title:
-                    return item["id"]["videoId"]
-        except Exception as e:
-            raise LoadError(
-                source="youtube_search",
-                message=f"Failed to search for '{track_name}' by '{artist_name}'",
-                original_error=e,
-            ) from e
+    try:
+        data = await api_request(
+            http_session,
+            limiter,
+            "GET",
+            f"{YOUTUBE_API_URL}/search",
+            params={
+                "part": "snippet",
+                "maxResults": 10,
+                "q": query,
+                "type": "video",
+                "videoCategoryId": "10",  # Music category
+            },
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        for item in data.get("items", []):
+            if _INSTR_RE.search(item["snippet"]["title"]):
+                return item["id"]["videoId"]
+    except Exception as e:
+        raise LoadError(
+            source="youtube_search",
+            message=f"Failed to search for '{track_name}' by '{artist_name}'",
+            original_error=e,
+        ) from e
 
     return None  # No matching instrumental/karaoke version found
 
@@ -247,40 +532,231 @@ def create_youtube_playlist(youtube, title, description=""):
         ) from e
 
 
-def add_video_to_playlist(youtube, playlist_id, video_id):
+def add_videos_to_playlist(youtube, playlist_id, video_ids):
     """
-    Add a video to a YouTube playlist.
+    Add videos to a YouTube playlist, sending up to YOUTUBE_BATCH_SIZE inserts per HTTP request.
+
+    The batch endpoint does not guarantee the order in which calls are applied,
+    so the playlist may not exactly follow the order of video_ids.
 
     Args:
         youtube (googleapiclient.discovery.Resource): An authenticated YouTube client instance.
-        playlist_id (str): The ID of the YouTube playlist to add the video to.
-        video_id (str): The YouTube video ID to be added to the playlist.
+        playlist_id (str): The ID of the YouTube playlist to add the videos to.
+        video_ids (list of str): The YouTube video IDs to be added.
 
     Returns:
-        None
+        list of str: Error messages for the videos that could not be added.
+    """
+    errors = []
 
-    Notes:
-        If adding the video fails, an error message is printed but the program continues.
+    def on_insert(request_id, response, exception):
+        if exception is not None:
+            video_id = video_ids[int(request_id)]
+            errors.append(
+                f"Failed to add {video_id} to the YouTube playlist: {exception}"
+            )
+
+    # insert() serializes the body right away, so one template can be reused
+    body_template = {
+        "snippet": {
+            "playlistId": playlist_id,
+            "resourceId": {"kind": "youtube#video", "videoId": None},
+        }
+    }
+    resource_id = body_template["snippet"]["resourceId"]
+    playlist_items = youtube.playlistItems()
+
+    for start in range(0, len(video_ids), YOUTUBE_BATCH_SIZE):
+        chunk = range(start, min(start + YOUTUBE_BATCH_SIZE, len(video_ids)))
+        batch = youtube.new_batch_http_request(callback=on_insert)
+        for idx in chunk:
+            resource_id["videoId"] = video_ids[idx]
+            batch.add(
+                playlist_items.insert(part="snippet", body=body_template),
+                request_id=str(idx),
+            )
+        try:
+            batch.execute()
+        except Exception as e:
+            for idx in chunk:
+                on_insert(str(idx), None, e)
+
+    return errors
+
+
+# -------------------- Transfer Module --------------------
+
+
+def extract_track(item):
     """
-    try:
-        request = youtube.playlistItems().insert(
-            part="snippet",
-            body={
-                "snippet": {
-                    "playlistId": playlist_id,
-                    "resourceId": {"kind": "youtube#video", "videoId": video_id},
-                }
-            },
-        )
-        request.execute()
-    except Exception as e:
-        raise LoadError(
-            source="add video",
-            message=f"Failed to add {video_id} to {playlist_id}",
-            original_error=e,
+    Extract the search terms of a Spotify playlist item.
+
+    Args:
+        item (dict): A track item from the Spotify playlist.
+
+    Returns:
+        tuple: The track name and comma-separated artist names. The track name is None
+            when the item has no track or the track has no name.
+    """
+    track = item.get("track") or {}
+    artists = track.get("artists") or []
+    return track.get("name"), ", ".join(a["name"] for a in artists if a.get("name"))
+
+
+async def _bounded_search(
+    http_session, semaphore, limiter, token, track_name, artist_names
+):
+    """
+    Run search_youtube_instrumental while holding a semaphore slot.
+
+    Args:
+        http_session (aiohttp.ClientSession): The HTTP session used for YouTube API requests.
+        semaphore (asyncio.Semaphore): Bounds how many API calls run at once.
+        limiter (RateLimiter): The rate limiter shared by all API requests.
+        token (str): OAuth 2.0 access token for the YouTube Data API.
+        track_name (str): The name of the track to search for.
+        artist_names (str): The comma-separated names of the track's artists.
+
+    Returns:
+        str or None: The YouTube video ID of the match, or None if none was found.
+    """
+    async with semaphore:
+        return await search_youtube_instrumental(
+            http_session, limiter, token, track_name, artist_names
         )
 
 
+async def process_track(
+    http_session,
+    semaphore,
+    limiter,
+    token,
+    track_name,
+    artist_names,
+    not_found,
+    errors,
+    cache,
+    searches,
+):
+    """
+    Find the instrumental version of one track.
+
+    Args:
+        http_session (aiohttp.ClientSession): The HTTP session used for YouTube API requests.
+        semaphore (asyncio.Semaphore): Bounds how many API calls run at once.
+        limiter (RateLimiter): The rate limiter shared by all API requests.
+        token (str): OAuth 2.0 access token for the YouTube Data API.
+        track_name (str): The name of the track to search for.
+        artist_names (str): The comma-separated names of the track's artists.
+        not_found (list of str): Tracks skipped or without an instrumental match.
+        errors (list of str): Error messages collected during processing.
+        cache (dict): Search results by _search_key; hits skip the YouTube search.
+        searches (dict): In-flight search tasks by _search_key, shared by duplicate tracks.
+
+    Returns:
+        str or None: The YouTube video ID of the match, or None if none was found.
+    """
+    try:
+        key = _search_key(track_name, artist_names)
+        if key in cache:
+            video_id = cache[key]
+        else:
+            if key not in searches:
+                searches[key] = asyncio.create_task(
+                    _bounded_search(
+                        http_session,
+                        semaphore,
+                        limiter,
+                        token,
+                        track_name,
+                        artist_names,
+                    )
+                )
+            video_id = await searches[key]
+            cache[key] = video_id
+
+        if not video_id:
+            not_found.append(
+                f"Instrumental not found for: '{track_name}' by '{artist_names}'"
+            )
+        return video_id
+    except LoadError as e:
+        error_msg = f"Error processing '{track_name}' by '{artist_names}': {str(e)}"
+        if e.original_error:
+            error_msg += f" ({e.original_error})"
+        errors.append(error_msg)
+        return None
+
+
+async def process_tracks(
+    sp,
+    playlist_id,
+    token,
+    rate_limit=DEFAULT_RATE_LIMIT,
+    concurrency=DEFAULT_CONCURRENCY,
+    cache=None,
+):
+    """
+    Search YouTube for an instrumental version of every track as the playlist streams in.
+
+    Args:
+        sp (spotipy.Spotify): An authenticated Spotipy client instance.
+        playlist_id (str): The Spotify Playlist ID to fetch tracks from.
+        token (str): OAuth 2.0 access token for the YouTube Data API.
+        rate_limit (float, optional): Maximum API requests started per second.
+        concurrency (int, optional): Maximum number of API calls in flight.
+        cache (dict, optional): Search results by _search_key, updated with new searches.
+
+    Returns:
+        tuple: The matched video IDs in playlist order, the tracks that were skipped
+            or had no instrumental match, and the list of error messages.
+
+    Raises:
+        LoadError: If fetching the Spotify playlist fails.
+    """
+    not_found = []
+    errors = []
+    cache = {} if cache is None else cache
+    semaphore = asyncio.Semaphore(concurrency)
+    limiter = RateLimiter(rate_limit)
+    tasks = []
+    searches = {}
+    async with aiohttp.ClientSession() as http_session:
+        try:
+            async for item in iter_spotify_tracks(sp, playlist_id):
+                track_name, artist_names = extract_track(item)
+                if not item.get("track"):
+                    not_found.append("Skipping item with no track information.")
+                    continue
+                if not track_name:
+                    not_found.append(
+                        f"Skipping a track by '{artist_names}': no track name."
+                    )
+                    continue
+                tasks.append(
+                    asyncio.create_task(
+                        process_track(
+                            http_session,
+                            semaphore,
+                            limiter,
+                            token,
+                            track_name,
+                            artist_names,
+                            not_found,
+                            errors,
+                            cache,
+                            searches,
+                        )
+                    )
+                )
+            results = await atqdm.gather(*tasks, desc="Processing tracks")
+        finally:
+            for task in (*tasks, *searches.values()):
+                task.cancel()
+
+    return [video_id for video_id in results if video_id], not_found, errors
+
+
 # -------------------- Main Module --------------------
 
 
@@ -292,14 +768,15 @@ def main():
         1. Load configuration from 'config.json'.
         2. Authenticate with Spotify using the loaded configuration.
         3. Retrieve the Spotify playlist ID from the configuration or user input.
-        4. Fetch all tracks from the specified Spotify playlist.
-        5. Authenticate with YouTube using 'client_secrets.json'.
-        6. Create a new YouTube playlist with user-provided title and description.
-        7. For each track in the Spotify playlist:
-            a. Search for an instrumental or karaoke version on YouTube.
-            b. If found, add the video to the YouTube playlist.
-            c. If not found, log that the instrumental was not found.
-        8. Notify the user upon completion.
+        4. Authenticate with YouTube using 'client_secrets.json'.
+        5. Ask for the title and description of the new YouTube playlist.
+        6. Stream the tracks of the Spotify playlist, searching YouTube concurrently for an
+           instrumental or karaoke version of each track as its page arrives, behind a
+           progress bar.
+        7. Create the new YouTube playlist.
+        8. Add the matches to the YouTube playlist in batched requests.
+        9. Notify the user upon completion, listing the tracks that were skipped or had no
+           match separately from errors.
 
     Returns:
         None
@@ -314,6 +791,19 @@ def main():
                 print(f"Original error: {e.original_error}")
             return
 
+        rate_limit = config.get("RATE_LIMIT", DEFAULT_RATE_LIMIT)
+        concurrency = config.get("CONCURRENCY", DEFAULT_CONCURRENCY)
+        if not isinstance(rate_limit, (int, float)) or rate_limit <= 0:
+            print(f"RATE_LIMIT must be a positive number, got {rate_limit!r}")
+            return
+        if not isinstance(concurrency, int) or concurrency < 1:
+            print(f"CONCURRENCY must be a positive integer, got {concurrency!r}")
+            return
+
+        # Reuse YouTube search results from earlier runs, saved again on exit
+        search_cache = load_search_cache(SEARCH_CACHE_FILE)
+        atexit.register(save_search_cache, SEARCH_CACHE_FILE, search_cache)
+
         # Authenticate with Spotify
         print("Authenticating with Spotify...")
         try:
@@ -332,21 +822,10 @@ def main():
                 print("Playlist ID is required. Defaulting to my playlist...")
                 playlist_id = "0mf8qkcdAMJ6UcJC7crcys"
 
-        # Fetch tracks
-        print("Fetching tracks from Spotify playlist...")
-        try:
-            tracks = get_spotify_playlist_tracks(sp, playlist_id)
-            print(f"Found {len(tracks)} tracks.")
-        except LoadError as e:
-            print(f"Failed to fetch playlist tracks: {str(e)}")
-            if e.original_error:
-                print(f"Original error: {e.original_error}")
-            return
-
         # Authenticate with YouTube
         print("Authenticating with YouTube...")
         try:
-            youtube = authenticate_youtube(
+            youtube, credentials = authenticate_youtube(
                 "client_secrets.json", ["https://www.googleapis.com/auth/youtube"]
             )
         except LoadError as e:
@@ -355,12 +834,31 @@ def main():
                 print(f"Original error: {e.original_error}")
             return
 
-        # Create YouTube playlist
         playlist_title = input("Enter title for the new YouTube playlist: ").strip()
         playlist_description = input(
             "Enter description for the new YouTube playlist (optional): "
         ).strip()
 
+        # Fetch tracks and search YouTube as the pages arrive
+        print("Fetching tracks from Spotify playlist...")
+        try:
+            video_ids, not_found, errors = asyncio.run(
+                process_tracks(
+                    sp,
+                    playlist_id,
+                    credentials.token,
+                    rate_limit=rate_limit,
+                    concurrency=concurrency,
+                    cache=search_cache,
+                )
+            )
+        except LoadError as e:
+            print(f"Failed to fetch playlist tracks: {str(e)}")
+            if e.original_error:
+                print(f"Original error: {e.original_error}")
+            return
+
+        # Create YouTube playlist
         try:
             youtube_playlist_id = create_youtube_playlist(
                 youtube, playlist_title, playlist_description
@@ -372,44 +870,13 @@ def main():
                 print(f"Original error: {e.original_error}")
             return
 
-        # Process tracks
-        errors = []
-        for idx, item in enumerate(tracks, start=1):
-            track = item.get("track")
-            if not track:
-                print(f"({idx}/{len(tracks)}) Skipping item with no track information.")
-                continue
-
-            track_name = track.get("name")
-            artists = track.get("artists", [])
-            artist_names = ", ".join([artist.get("name") for artist in artists])
-
-            print(
-                f"({idx}/{len(tracks)}) Searching instrumental for: '{track_name}' by '{artist_names}'"
-            )
-
-            try:
-                video_id = search_youtube_instrumental(
-                    youtube, track_name, artist_names
-                )
-                if video_id:
-                    add_video_to_playlist(youtube, youtube_playlist_id, video_id)
-                    print(f"Added video ID {video_id} to YouTube playlist.")
-                else:
-                    print(
-                        f"Instrumental not found for: '{track_name}' by '{artist_names}'"
-                    )
-            except LoadError as e:
-                error_msg = (
-                    f"Error processing '{track_name}' by '{artist_names}': {str(e)}"
-                )
-                print(error_msg)
-                if e.original_error:
-                    print(f"Original error: {e.original_error}")
-                errors.append(error_msg)
-                continue
+        errors.extend(add_videos_to_playlist(youtube, youtube_playlist_id, video_ids))
 
         print("\nYouTube playlist creation complete!")
+        if not_found:
+            print("\nThe following tracks were not transferred:")
+            for entry in not_found:
+                print(f"- {entry}")
         if errors:
             print("\nThe following errors occurred during processing:")
             for error in errors: